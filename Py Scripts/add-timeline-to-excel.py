@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
+import os
 import re
+import sys
+
+# Py Scripts/ runs from the repo root; syntax_gate lives there
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from syntax_gate import write_checked
 
 with open('src/utils/export/excel-generator.js', 'r') as f:
     content = f.read()
@@ -81,8 +87,8 @@ new_append = '''  XLSX.utils.book_append_sheet(workbook, roiSheet, 'ROI Metrics'
 
 content = content.replace(old_append, new_append)
 
-with open('src/utils/export/excel-generator.js', 'w') as f:
-    f.write(content)
+if not write_checked('src/utils/export/excel-generator.js', content):
+    sys.exit(1)
 
 print("✓ Added Timeline sheet to Excel export")
 print("  - Timeline Summary (sequential, parallelized, time saved)")
@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
+import os
 import re
+import sys
+
+# Py Scripts/ runs from the repo root; syntax_gate lives there
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from syntax_gate import write_checked
 
 # Start from backup
 with open('src/utils/export/pdf-generator.js.backup_temp', 'r') as f:
@@ -36,8 +42,8 @@ content = re.sub(
     flags=re.MULTILINE
 )
 
-with open('src/utils/export/pdf-generator.js', 'w') as f:
-    f.write(content)
+if not write_checked('src/utils/export/pdf-generator.js', content):
+    sys.exit(1)
 
 print("✓ Complete PDF fix applied")
 print("  - Fixed template literals (single quotes → backticks)")
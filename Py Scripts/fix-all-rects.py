@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
+import os
 import re
+import sys
+
+# Py Scripts/ runs from the repo root; syntax_gate lives there
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from syntax_gate import write_checked
 
 with open('src/utils/export/pdf-generator.js', 'r') as f:
     content = f.read()
@@ -33,8 +39,8 @@ content = re.sub(
     flags=re.MULTILINE
 )
 
-with open('src/utils/export/pdf-generator.js', 'w') as f:
-    f.write(content)
+if not write_checked('src/utils/export/pdf-generator.js', content):
+    sys.exit(1)
 
 print("✓ Wrapped all 25 rect/roundedRect calls with try-catch blocks")
 print("  - Any rect with invalid parameters will be skipped")
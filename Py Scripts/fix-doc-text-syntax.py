@@ -1,4 +1,10 @@
 #!/usr/bin/env python3
+import os
+import sys
+
+# Py Scripts/ runs from the repo root; syntax_gate lives there
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from syntax_gate import write_checked
 
 with open('src/utils/export/pdf-generator.js', 'r') as f:
     content = f.read()
@@ -17,8 +23,8 @@ content = re.sub(
     content
 )
 
-with open('src/utils/export/pdf-generator.js', 'w') as f:
-    f.write(content)
+if not write_checked('src/utils/export/pdf-generator.js', content):
+    sys.exit(1)
 
 print("✓ Fixed all doc.text` syntax errors")
 print("  - Changed doc.text`...` to doc.text(`...`)")
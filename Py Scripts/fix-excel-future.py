@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
+import os
 import re
+import sys
+
+# Py Scripts/ runs from the repo root; syntax_gate lives there
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from syntax_gate import write_checked
 
 with open('src/utils/export/excel-generator.js', 'r') as f:
     content = f.read()
@@ -72,7 +78,7 @@ new_function = '''function createFutureStateSheet(calculations) {
 
 content = re.sub(old_pattern, new_function, content, flags=re.DOTALL)
 
-with open('src/utils/export/excel-generator.js', 'w') as f:
-    f.write(content)
+if not write_checked('src/utils/export/excel-generator.js', content):
+    sys.exit(1)
 
 print("✓ Fixed Excel Future State sheet to match actual data structure")
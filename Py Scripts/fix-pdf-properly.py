@@ -1,4 +1,10 @@
 #!/usr/bin/env python3
+import os
+import sys
+
+# Py Scripts/ runs from the repo root; syntax_gate lives there
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from syntax_gate import write_checked
 
 # Read the backup
 try:
@@ -50,8 +56,8 @@ replacement = '''// Bar chart visualization with safety checks
 
 content = re.sub(pattern, replacement, content, flags=re.DOTALL)
 
-with open('src/utils/export/pdf-generator.js', 'w') as f:
-    f.write(content)
+if not write_checked('src/utils/export/pdf-generator.js', content):
+    sys.exit(1)
 
 print("✓ Fixed PDF bar chart section with unique variable names")
 print("  - Used currentAnnualCost/futureAnnualCost to avoid conflicts")
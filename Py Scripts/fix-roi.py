@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
+import os
 import re
+import sys
+
+# Py Scripts/ runs from the repo root; syntax_gate lives there
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from syntax_gate import write_checked
 
 # Read the file
 with open('src/utils/business-case/roi-calculator.js', 'r') as f:
@@ -32,7 +38,7 @@ new_code = '''  // Calculate payback and ROI with safety checks
 content = content.replace(old_code, new_code)
 
 # Write back
-with open('src/utils/business-case/roi-calculator.js', 'w') as f:
-    f.write(content)
+if not write_checked('src/utils/business-case/roi-calculator.js', content):
+    sys.exit(1)
 
 print("✓ Fixed ROI calculator with safety checks")
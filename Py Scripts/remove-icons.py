@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import os
+import sys
+
+# Py Scripts/ runs from the repo root; syntax_gate lives there
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from syntax_gate import write_checked
 
 with open('src/utils/export/pdf-generator.js', 'r', encoding='utf-8') as f:
     content = f.read()
@@ -10,7 +16,7 @@ content = content.replace('Ï', '')
 content = content.replace('↓', '')  # Remove arrow too
 content = content.replace('₂', '2')  # Fix CO2 subscript
 
-with open('src/utils/export/pdf-generator.js', 'w', encoding='utf-8') as f:
-    f.write(content)
+if not write_checked('src/utils/export/pdf-generator.js', content):
+    sys.exit(1)
 
 print("✓ Removed all unicode icon characters")
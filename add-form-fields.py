@@ -1,4 +1,7 @@
 #!/usr/bin/env python3
+import sys
+
+from syntax_gate import write_checked
 
 with open('src/components/business-case/CustomerProfile/CustomerProfileForm.jsx', 'r') as f:
     content = f.read()
@@ -93,7 +96,7 @@ new_timeline_section = """      {/* Timeline Section */}
 
 content = content.replace(old_timeline_section, new_timeline_section)
 
-with open('src/components/business-case/CustomerProfile/CustomerProfileForm.jsx', 'w') as f:
-    f.write(content)
+if not write_checked('src/components/business-case/CustomerProfile/CustomerProfileForm.jsx', content):
+    sys.exit(1)
 
 print("✓ Added UI fields for useCaseCount, appCount, and plannedStartDate")
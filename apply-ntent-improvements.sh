@@ -68,9 +68,6 @@ read -r response
 if [[ "$response" =~ ^[Yy]$ ]]; then
     echo -e "\n${BLUE}Adding NTENT badges with discovery questions...${NC}"
     
-    # This is where we'd add all the sed commands
-    # For now, let's show what would be added
-    
     echo -e "\n${GREEN}Fields that will get NTENT badges:${NC}"
     echo "  [N] Company Name - Next Step"
     echo "  [N] Industry - Need"
@@ -86,13 +83,10 @@ if [[ "$response" =~ ^[Yy]$ ]]; then
     echo "  [T] Technical Contact - Teams"
     echo "  [N] Financial Contact - Next Step"
     
-    # Run the detailed implementation script
-    if [ -f "/mnt/user-data/outputs/improve-business-case-ntent.sh" ]; then
-        chmod +x /mnt/user-data/outputs/improve-business-case-ntent.sh
-        /mnt/user-data/outputs/improve-business-case-ntent.sh
-    fi
+    # Badge the Customer Profile form in one pass
+    python3 inject-ntent-badges.py src/components/business-case/CustomerProfile/CustomerProfileForm.jsx
 else
-    echo -e "\n${YELLOW}Skipping badge implementation. Run improve-business-case-ntent.sh later.${NC}"
+    echo -e "\n${YELLOW}Skipping badge implementation. Run python3 inject-ntent-badges.py src/components/business-case/CustomerProfile/CustomerProfileForm.jsx later.${NC}"
 fi
 
 echo -e "\n${GREEN}═══════════════════════════════════════════════════════════${NC}"
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Compile the *_COACHING_INSTRUCTIONS.txt files into a field-id keyed hint index.
+
+Reads the TooltipCoach blocks that the implement-ntent-* scripts splice into
+JSX and writes src/constants/coachingHints.js, so the coach hook can look up a
+field's hint in O(1) instead of the text living only in free-form notes.
+
+Run with: npm run compile:coaching
+"""
+import glob
+import json
+import re
+import sys
+
+from syntax_gate import write_checked
+
+OUTPUT_FILE = 'src/constants/coachingHints.js'
+
+# {coach.hint?.id === 'field' && ( <TooltipCoach ...> body </TooltipCoach> )}
+HINT_BLOCK = re.compile(
+    r"\{coach\.hint\?\.id === '(?P<id>\w+)' && \(\s*"
+    r"<TooltipCoach(?P<attrs>[^>]*)>\s*(?P<body>.*?)\s*</TooltipCoach>",
+    re.S,
+)
+
+# {coach.shouldNudge('field') && ( <TooltipCoach ...> body </TooltipCoach> )}
+NUDGE_BLOCK = re.compile(
+    r"\{coach\.shouldNudge\('(?P<id>\w+)'\) && \(\s*"
+    r"<TooltipCoach(?P<attrs>[^>]*)>\s*(?P<body>.*?)\s*</TooltipCoach>",
+    re.S,
+)
+
+ATTR = re.compile(r'(\w+)="([^"]*)"')
+LABEL = re.compile(r'^<strong>(?P<label>[^<]+?):?</strong>\s*')
+
+
+def parse_attrs(attrs):
+    return dict(ATTR.findall(attrs))
+
+
+def parse_body(body):
+    body = ' '.join(line.strip() for line in body.splitlines()).strip()
+    label = None
+    match = LABEL.match(body)
+    if match:
+        label = match.group('label')
+        body = body[match.end():]
+    if body.startswith('💡'):
+        body = body[len('💡'):].strip()
+    return label, body
+
+
+def compile_file(path, index):
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    # First line reads e.g. "CURRENT STATE CONFIG - NTENT Coaching"
+    form = content.splitlines()[0].split(' - ')[0].strip().title()
+
+    for match in HINT_BLOCK.finditer(content):
+        attrs = parse_attrs(match.group('attrs'))
+        label, text = parse_body(match.group('body'))
+        entry = index.setdefault(match.group('id'), {'form': form, 'hint': None, 'nudge': None})
+        entry['hint'] = {
+            'tone': attrs.get('tone', 'info'),
+            'dimension': attrs.get('ntentDimension'),
+            'label': label,
+            'text': text,
+        }
+
+    for match in NUDGE_BLOCK.finditer(content):
+        attrs = parse_attrs(match.group('attrs'))
+        _, text = parse_body(match.group('body'))
+        entry = index.setdefault(match.group('id'), {'form': form, 'hint': None, 'nudge': None})
+        entry['nudge'] = {
+            'tone': attrs.get('tone', 'tip'),
+            'text': text,
+        }
+
+
+def main():
+    sources = sorted(glob.glob('*_COACHING_INSTRUCTIONS.txt'))
+    if not sources:
+        print("❌ Error: no *_COACHING_INSTRUCTIONS.txt files found (run from the repo root)")
+        sys.exit(1)
+
+    index = {}
+    for path in sources:
+        before = len(index)
+        compile_file(path, index)
+        print(f"✓ {path}: {len(index) - before} field(s)")
+
+    body = json.dumps(dict(sorted(index.items())), indent=2, ensure_ascii=False)
+
+    output = (
+        "// AUTO-GENERATED by compile-coaching-hints.py from *_COACHING_INSTRUCTIONS.txt\n"
+        "// Do not edit by hand - update the instruction files and re-run: npm run compile:coaching\n\n"
+        f"export const COACHING_HINTS = Object.freeze({body});\n\n"
+        "export function getCoachingHint(id) {\n"
+        "  return COACHING_HINTS[id] || null;\n"
+        "}\n"
+    )
+    if not write_checked(OUTPUT_FILE, output):
+        sys.exit(1)
+
+    print(f"\n✓ Wrote {len(index)} coaching hints to {OUTPUT_FILE}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 import re
+import sys
+
+from syntax_gate import write_checked
 
 # Start from backup
 with open('src/utils/export/pdf-generator.js.backup_temp', 'r', encoding='utf-8') as f:
@@ -71,7 +74,7 @@ def fix_implementation(match):
 content = re.sub(roadmap_pattern, fix_implementation, content, flags=re.DOTALL)
 print("✓ Fixed implementation NaN values")
 
-with open('src/utils/export/pdf-generator.js', 'w', encoding='utf-8') as f:
-    f.write(content)
+if not write_checked('src/utils/export/pdf-generator.js', content):
+    sys.exit(1)
 
 print("\n✅ Complete PDF fix applied successfully!")
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 import re
+import sys
+
+from syntax_gate import write_checked
 
 with open('src/utils/export/pdf-generator.js', 'r', encoding='utf-8') as f:
     content = f.read()
@@ -11,8 +14,8 @@ with open('src/utils/export/pdf-generator.js', 'r', encoding='utf-8') as f:
 # Replace doc.text` with doc.text(`
 content = re.sub(r'doc\.text`([^`]+)`', r'doc.text(`\1`)', content)
 
-with open('src/utils/export/pdf-generator.js', 'w', encoding='utf-8') as f:
-    f.write(content)
+if not write_checked('src/utils/export/pdf-generator.js', content):
+    sys.exit(1)
 
 print("✓ Fixed all remaining doc.text` syntax errors")
 
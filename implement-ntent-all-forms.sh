@@ -39,7 +39,7 @@ sed -i '5a import NTENTLegend from '\''./ui/NTENTLegend'\'';\nimport NTENTBadge
 
 echo -e "${GREEN}✓ TimelineCalculator imports added${NC}"
 echo -e "${YELLOW}  Manual: Add <NTENTLegend compact={true} /> at top of form${NC}"
-echo -e "${YELLOW}  Manual: Add badges to Go-Live Date and key complexity fields${NC}\n"
+echo -e "${YELLOW}  Badges: run python3 inject-ntent-badges.py src/components/TimelineCalculator.jsx${NC}\n"
 
 ########################################
 # CUSTOMER PROFILE FORM
@@ -50,7 +50,7 @@ echo -e "${BLUE}[2/4] Adding NTENT to CustomerProfileForm.jsx${NC}"
 sed -i '4a import NTENTLegend from '\''../../ui/NTENTLegend'\'';\nimport NTENTBadge from '\''../../ui/NTENTBadge'\'';' src/components/business-case/CustomerProfile/CustomerProfileForm.jsx
 
 echo -e "${GREEN}✓ CustomerProfileForm imports added${NC}"
-echo -e "${YELLOW}  Manual: Add legend and badges to key fields${NC}\n"
+echo -e "${YELLOW}  Manual: Add legend (badges: python3 inject-ntent-badges.py src/components/business-case/CustomerProfile/CustomerProfileForm.jsx)${NC}\n"
 
 ########################################
 # CURRENT STATE CONFIG
@@ -61,7 +61,7 @@ echo -e "${BLUE}[3/4] Adding NTENT to CurrentStateConfig.jsx${NC}"
 sed -i '2a import NTENTLegend from '\''../ui/NTENTLegend'\'';\nimport NTENTBadge from '\''../ui/NTENTBadge'\'';' src/components/business-case/CurrentStateConfig.jsx
 
 echo -e "${GREEN}✓ CurrentStateConfig imports added${NC}"
-echo -e "${YELLOW}  Manual: Add legend and badges${NC}\n"
+echo -e "${YELLOW}  Manual: Add legend (badges: python3 inject-ntent-badges.py src/components/business-case/CurrentStateConfig.jsx)${NC}\n"
 
 ########################################
 # FUTURE STATE CONFIG
@@ -72,7 +72,7 @@ echo -e "${BLUE}[4/4] Adding NTENT to FutureStateConfig.jsx${NC}"
 sed -i '2a import NTENTLegend from '\''../ui/NTENTLegend'\'';\nimport NTENTBadge from '\''../ui/NTENTBadge'\'';' src/components/business-case/FutureStateConfig.jsx
 
 echo -e "${GREEN}✓ FutureStateConfig imports added${NC}"
-echo -e "${YELLOW}  Manual: Add legend and badges${NC}\n"
+echo -e "${YELLOW}  Manual: Add legend (badges: python3 inject-ntent-badges.py src/components/business-case/FutureStateConfig.jsx)${NC}\n"
 
 ########################################
 # CREATE COMPREHENSIVE GUIDE
@@ -369,7 +369,7 @@ echo ""
 echo -e "${YELLOW}Next Steps:${NC}"
 echo "  1. Read: NTENT_BADGES_COMPLETE_GUIDE.txt"
 echo "  2. Add <NTENTLegend compact={true} /> to top of each form"
-echo "  3. Add <NTENTBadge dimension='...' /> to ~20-25 key fields"
+echo "  3. Add badges to every form: python3 inject-ntent-badges.py"
 echo "  4. Test: npm run dev"
 echo ""
 echo -e "${GREEN}This will add NTENT discovery to your ENTIRE app!${NC}"
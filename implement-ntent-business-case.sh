@@ -259,83 +259,8 @@ fi
 # ==============================================================================
 echo -e "${YELLOW}Step 7: Adding NTENT badges to field labels...${NC}"
 
-# Company Name
-if ! grep -A1 "Company Name \*" "$FORM_FILE" | grep -q "NTENTBadge"; then
-    sed -i '/Company Name \*/a\          <NTENTBadge dimension="next" tooltip="Use full legal entity name - appears on MSA\/PO. Who signs contracts?" />' "$FORM_FILE"
-    echo "  ✓ Company Name [N]"
-fi
-
-# Industry
-if ! grep -A1 "Industry \*" "$FORM_FILE" | grep -q "NTENTBadge"; then
-    sed -i '/Industry \*/a\          <NTENTBadge dimension="need" tooltip="What industry-specific compliance drives urgency? (HIPAA, PCI, SOX)" />' "$FORM_FILE"
-    echo "  ✓ Industry [N]"
-fi
-
-# Total Users
-if ! grep -A1 "Total Number of Users" "$FORM_FILE" | grep -q "NTENTBadge"; then
-    sed -i '/Total Number of Users/a\          <NTENTBadge dimension="need" tooltip="How many users need access TODAY vs. next 12 months? What drives growth?" />' "$FORM_FILE"
-    echo "  ✓ Total Users [N]"
-fi
-
-# User Profile
-if ! grep -A1 "User Profile Type" "$FORM_FILE" | grep -q "NTENTBadge"; then
-    sed -i '/User Profile Type/a\          <NTENTBadge dimension="risk" tooltip="What % are power users? GPU needs? What breaks their current setup?" />' "$FORM_FILE"
-    echo "  ✓ User Profile [R]"
-fi
-
-# Use Cases
-if ! grep -A1 "Number of Use Cases" "$FORM_FILE" | grep -q "NTENTBadge"; then
-    sed -i '/Number of Use Cases/a\          <NTENTBadge dimension="need" tooltip="What are the TOP 3 use cases? Which one fails most often today?" />' "$FORM_FILE"
-    echo "  ✓ Use Cases [N]"
-fi
-
-# Applications
-if ! grep -A1 "Number of Applications" "$FORM_FILE" | grep -q "NTENTBadge"; then
-    sed -i '/Number of Applications/a\          <NTENTBadge dimension="risk" tooltip="How many are CRITICAL? How many tested in cloud? Which have no vendor support?" />' "$FORM_FILE"
-    echo "  ✓ Applications [R]"
-fi
-
-# Current Platform
-if ! grep -A1 "Current Platform" "$FORM_FILE" | grep -q "NTENTBadge"; then
-    sed -i '/Current Platform/a\          <NTENTBadge dimension="risk" tooltip="What platform TODAY? What do they HATE about it? When does contract end?" />' "$FORM_FILE"
-    echo "  ✓ Current Platform [R]"
-fi
-
-# Planned Start Date
-if ! grep -A1 "Planned Start Date" "$FORM_FILE" | grep -q "NTENTBadge"; then
-    sed -i '/Planned Start Date/a\          <NTENTBadge dimension="next" tooltip="What HAS to happen before you can start? Who needs to approve start?" />' "$FORM_FILE"
-    echo "  ✓ Start Date [N]"
-fi
-
-# Target Go-Live Date
-if ! grep -A1 "Target Go-Live Date" "$FORM_FILE" | grep -q "NTENTBadge"; then
-    sed -i '/Target Go-Live Date/a\          <NTENTBadge dimension="time" tooltip="What happens if you miss this date? Who set this deadline and why?" />' "$FORM_FILE"
-    echo "  ✓ Go-Live Date [T]"
-fi
-
-# Compelling Event
-if ! grep -A1 "Compelling Event" "$FORM_FILE" | grep -q "NTENTBadge"; then
-    sed -i '/Compelling Event/a\          <NTENTBadge dimension="time" tooltip="Contract expiring? Data center closing? Compliance deadline? M&A activity?" />' "$FORM_FILE"
-    echo "  ✓ Compelling Event [T]"
-fi
-
-# Primary Contact
-if ! grep -A1 "Primary Contact" "$FORM_FILE" | grep -q "NTENTBadge"; then
-    sed -i '/Primary Contact$/a\          <NTENTBadge dimension="teams" tooltip="Are they the champion? Do they control budget? Who is their boss?" />' "$FORM_FILE"
-    echo "  ✓ Primary Contact [T]"
-fi
-
-# Technical Contact
-if ! grep -A1 "Technical Contact" "$FORM_FILE" | grep -q "NTENTBadge"; then
-    sed -i '/Technical Contact$/a\          <NTENTBadge dimension="teams" tooltip="Do they recommend or approve? What tech do they love\/hate?" />' "$FORM_FILE"
-    echo "  ✓ Technical Contact [T]"
-fi
-
-# Financial Contact
-if ! grep -A1 "Financial Contact" "$FORM_FILE" | grep -q "NTENTBadge"; then
-    sed -i '/Financial Contact$/a\          <NTENTBadge dimension="next" tooltip="Do they approve POs? What is their approval limit? When do they review?" />' "$FORM_FILE"
-    echo "  ✓ Financial Contact [N]"
-fi
+# One pass per file via the shared injector table; already-badged labels are skipped
+python3 inject-ntent-badges.py "$FORM_FILE"
 
 echo ""
 
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Inject NTENT badges into every wizard form in a single pass per file.
+
+Replaces the sed-per-field approach of add-timeline-badges.sh and the
+implement-ntent-*/improve-* scripts: every label anchor for a file is matched
+in one Aho-Corasick scan, all inserts are applied in one rewrite, and anchors
+already followed by their NTENTBadge are skipped, so re-running is a no-op.
+No *_backup copies are written - git already has the previous version.
+
+Usage:
+  python3 inject-ntent-badges.py                                      # all forms
+  python3 inject-ntent-badges.py src/components/TimelineCalculator.jsx  # one form
+  python3 inject-ntent-badges.py --dry-run                            # report only
+"""
+import os
+import re
+import sys
+from collections import deque
+
+from syntax_gate import write_checked
+
+TIMELINE = 'src/components/TimelineCalculator.jsx'
+CUSTOMER_PROFILE = 'src/components/business-case/CustomerProfile/CustomerProfileForm.jsx'
+CURRENT_STATE = 'src/components/business-case/CurrentStateConfig.jsx'
+FUTURE_STATE = 'src/components/business-case/FutureStateConfig.jsx'
+
+
+def badge(dimension, tooltip):
+    return f'<NTENTBadge dimension="{dimension}" tooltip="{tooltip}" />'
+
+
+# Label anchor -> JSX inserted on the line after it. An anchor only matches
+# when it is the whole (trimmed) text of its line, i.e. a label's caption.
+BADGES = {
+    # The D* questions are rendered from QUESTIONS through QuestionCard and have
+    # no caption line to anchor on - only the go-live date input does.
+    TIMELINE: {
+        'Target Go-Live Date *': badge('time', 'What date is immovable? What happens if you miss it?'),
+    },
+    CUSTOMER_PROFILE: {
+        'Company Name *': badge('next', 'Use full legal entity name - appears on MSA/PO. Who signs contracts?'),
+        'Industry *': badge('need', 'What industry-specific compliance drives urgency? (HIPAA, PCI, SOX)'),
+        'Total Number of Users *': badge('need', 'How many users need access TODAY vs. next 12 months? What drives growth?'),
+        'User Profile Type': badge('risk', 'What % are power users? GPU needs? What breaks their current setup?'),
+        'Number of Use Cases': badge('need', 'What are the TOP 3 use cases? Which one fails most often today?'),
+        'Number of Applications': badge('risk', 'How many are CRITICAL? How many tested in cloud? Which have no vendor support?'),
+        'Current Platform': badge('risk', 'What platform TODAY? What do they HATE about it? When does contract end?'),
+        'Planned Start Date': badge('next', 'What HAS to happen before you can start? Who needs to approve start?'),
+        'Target Go-Live Date': badge('time', 'What happens if you miss this date? Who set this deadline and why?'),
+        'Compelling Event': badge('time', 'Contract expiring? Data center closing? Compliance deadline? M&A activity?'),
+        'Primary Contact': badge('teams', 'Are they the champion? Do they control budget? Who is their boss?'),
+        'Technical Contact': badge('teams', 'Do they recommend or approve? What tech do they love/hate?'),
+        'Financial Contact': badge('next', 'Do they approve POs? What is their approval limit? When do they review?'),
+    },
+    CURRENT_STATE: {
+        'Number of Servers': badge('need', 'How many servers does the current VDI estate run on?'),
+        'Monthly Cost (USD)': badge('need', 'Rough OK. Which metric matters to CFO: savings, risk, or speed?'),
+        'Annual Cost (USD)': badge('need', 'Rough OK. Which metric matters to CFO: savings, risk, or speed?'),
+    },
+    FUTURE_STATE: {
+        'User Workload Profile': badge('need', 'Which user types deliver fastest ROI?'),
+        'Storage Type': badge('edu', 'What proof do you need? Performance test?'),
+        'Include Nerdio Manager for Enterprise': badge('edu', 'What proof removes doubt about automation value?'),
+        'TCO/ROI Time Horizon': badge('time', 'When does leadership expect payback?'),
+    },
+}
+
+# Import added (after the last import statement) when a file gains its first badge
+IMPORTS = {
+    TIMELINE: "import NTENTBadge from './ui/NTENTBadge';",
+    CUSTOMER_PROFILE: "import NTENTBadge from '../../ui/NTENTBadge';",
+    CURRENT_STATE: "import NTENTBadge from '../ui/NTENTBadge';",
+    FUTURE_STATE: "import NTENTBadge from '../ui/NTENTBadge';",
+}
+
+# A line that closes an import: `... from 'x';` or a bare `import 'x';`
+IMPORT_END = re.compile(r"""(^import\s+|\bfrom\s+)['"][^'"]+['"]""")
+
+
+class AhoCorasick:
+    """Multi-pattern matcher: finds every occurrence of every pattern in one scan."""
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]
+
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            self.out[state].append(index)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[nxt] = self.goto[fallback].get(char, 0)
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def search(self, text):
+        """Yield (start, pattern_index) for every match in text."""
+        state = 0
+        for pos, char in enumerate(text):
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            for index in self.out[state]:
+                yield pos - len(self.patterns[index]) + 1, index
+
+
+def plan_inserts(content, anchors, matcher):
+    """Return ({line_end_offset: (anchor, line)}, already_badged) for whole-line anchor matches."""
+    inserts = {}
+    already = set()
+
+    for start, index in matcher.search(content):
+        anchor = matcher.patterns[index]
+        line_start = content.rfind('\n', 0, start) + 1
+        line_end = content.find('\n', start)
+        if line_end == -1:
+            line_end = len(content)
+        line = content[line_start:line_end]
+        if line.strip() != anchor:
+            continue
+
+        # Skip anchors already followed by their badge (inline or on the next line)
+        next_end = content.find('\n', line_end + 1)
+        following = content[line_end + 1:next_end if next_end != -1 else len(content)]
+        if anchors[anchor].strip() in following or '<NTENTBadge' in following:
+            already.add(anchor)
+            continue
+
+        inserts[line_end] = (anchor, line)
+
+    return inserts, already
+
+
+def add_import(content, statement):
+    """Insert statement after the line that ends the last import (multi-line imports included)."""
+    if statement in content or 'import NTENTBadge ' in content:
+        return content
+    lines = content.split('\n')
+    last_import = -1
+    in_import = False
+    for i, line in enumerate(lines):
+        if line.startswith('import '):
+            in_import = True
+        if in_import and IMPORT_END.search(line):
+            last_import = i
+            in_import = False
+    lines.insert(last_import + 1, statement)
+    return '\n'.join(lines)
+
+
+def inject(content, anchors, import_statement):
+    """Return (updated, inserts, already) with every badge for this file spliced in one pass."""
+    matcher = AhoCorasick(anchors)
+    inserts, already = plan_inserts(content, anchors, matcher)
+
+    parts = []
+    cursor = 0
+    for offset in sorted(inserts):
+        anchor, line = inserts[offset]
+        indent = line[:len(line) - len(line.lstrip())]
+        parts.append(content[cursor:offset])
+        parts.append(f"\n{indent}{anchors[anchor]}")
+        cursor = offset
+    parts.append(content[cursor:])
+    updated = ''.join(parts)
+
+    if inserts:
+        updated = add_import(updated, import_statement)
+
+    return updated, inserts, already
+
+
+def inject_file(path, anchors, dry_run=False):
+    """Badge one file; return (badges added, ok)."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except FileNotFoundError:
+        print(f"❌ {path} not found")
+        return 0, False
+
+    updated, inserts, already = inject(content, anchors, IMPORTS[path])
+
+    placed = {anchor for anchor, _ in inserts.values()}
+    missing = sorted(set(anchors) - placed - already)
+
+    print(f"✓ {path}: {len(inserts)} added, {len(already)} already badged, {len(missing)} not found")
+    for anchor in missing:
+        print(f"    - no label: {anchor}")
+
+    if updated != content and not dry_run and not write_checked(path, updated):
+        return 0, False
+
+    return len(inserts), True
+
+
+def main():
+    args = sys.argv[1:]
+    dry_run = '--dry-run' in args
+    targets = [os.path.relpath(os.path.abspath(arg)) for arg in args if not arg.startswith('--')]
+
+    unknown = [path for path in targets if path not in BADGES]
+    if unknown:
+        print(f"❌ No badge table for: {', '.join(unknown)}")
+        print(f"   Known files: {', '.join(BADGES)}")
+        sys.exit(1)
+
+    total = 0
+    failed = []
+    for path in targets or BADGES:
+        added, ok = inject_file(path, BADGES[path], dry_run)
+        total += added
+        if not ok:
+            failed.append(path)
+
+    if failed:
+        print(f"\n❌ Badges not written for {len(failed)} file(s): {', '.join(failed)}")
+        sys.exit(1)
+
+    print(f"\n✓ {'Would add' if dry_run else 'Added'} {total} NTENT badge(s)")
+
+
+if __name__ == '__main__':
+    main()
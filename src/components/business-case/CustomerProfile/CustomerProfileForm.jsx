@@ -254,7 +254,12 @@ export default function CustomerProfileForm({ onComplete, initialData }) {
             <input
               type="number"
               value={formData.totalUsers}
-              onChange={(e) => handleInputChange('totalUsers', parseInt(e.target.value))}
+              onChange={(e) => {
+                handleInputChange('totalUsers', parseInt(e.target.value));
+                coach.onEdit('totalUsers');
+              }}
+              onFocus={() => coach.onFocus('totalUsers')}
+              onBlur={coach.onBlur}
               className={`w-full px-4 py-2 border-2 rounded-lg focus:outline-none ${
                 errors.totalUsers 
                   ? 'border-red-500 focus:border-red-600' 
@@ -266,6 +271,16 @@ export default function CustomerProfileForm({ onComplete, initialData }) {
             {errors.totalUsers && (
               <p className="text-red-600 text-sm mt-1">{errors.totalUsers}</p>
             )}
+            {coach.hint?.id === 'totalUsers' && coach.hint.content?.hint && (
+              <TooltipCoach tone={coach.hint.content.hint.tone} ntentDimension={coach.hint.content.hint.dimension}>
+                <strong>{coach.hint.content.hint.label}:</strong> {coach.hint.content.hint.text}
+              </TooltipCoach>
+            )}
+            {coach.shouldNudge('totalUsers') && coach.hintFor('totalUsers')?.nudge && (
+              <TooltipCoach tone={coach.hintFor('totalUsers').nudge.tone}>
+                💡 {coach.hintFor('totalUsers').nudge.text}
+              </TooltipCoach>
+            )}
           </div>
 
           <div>
@@ -0,0 +1,107 @@
+// AUTO-GENERATED by compile-coaching-hints.py from *_COACHING_INSTRUCTIONS.txt
+// Do not edit by hand - update the instruction files and re-run: npm run compile:coaching
+
+export const COACHING_HINTS = Object.freeze({
+  "criticalApps": {
+    "form": "Customer Profile Form",
+    "hint": {
+      "tone": "risk",
+      "dimension": "R",
+      "label": "Risk",
+      "text": "Which 3-5 apps are business-critical and need compatibility testing?"
+    },
+    "nudge": {
+      "tone": "risk",
+      "text": "Office 365 doesn't count - it's always compatible. Focus on LOB apps"
+    }
+  },
+  "currentAnnualCost": {
+    "form": "Current State Config",
+    "hint": {
+      "tone": "need",
+      "dimension": "N",
+      "label": "Need",
+      "text": "Rough order of magnitude OK. Which metric matters most to CFO: $ savings, risk, or speed?"
+    },
+    "nudge": {
+      "tone": "need",
+      "text": "$50K vs $500K matters more than exact amount. Check last year's budget or ask finance"
+    }
+  },
+  "executiveSponsor": {
+    "form": "Customer Profile Form",
+    "hint": {
+      "tone": "teams",
+      "dimension": "T",
+      "label": "Teams",
+      "text": "Who must say 'yes' to move from pilot → rollout?"
+    },
+    "nudge": {
+      "tone": "teams",
+      "text": "Include title and approval order: \"Jane Smith, VP IT (after CFO sign-off)\""
+    }
+  },
+  "goLiveDate": {
+    "form": "Timeline Calculator",
+    "hint": {
+      "tone": "time",
+      "dimension": "T",
+      "label": "Timing",
+      "text": "What date is immovable (renewal, audit, end-of-support)? What happens if you miss it?"
+    },
+    "nudge": {
+      "tone": "time",
+      "text": "Most AVD projects need 12-16 weeks. Consider blackout periods (holidays, fiscal close)"
+    }
+  },
+  "infrastructureCost": {
+    "form": "Current State Config",
+    "hint": {
+      "tone": "need",
+      "dimension": "N",
+      "label": "Need",
+      "text": "Include hardware depreciation, data center costs, and maintenance contracts"
+    },
+    "nudge": null
+  },
+  "lightUsers": {
+    "form": "Future State Config",
+    "hint": {
+      "tone": "need",
+      "dimension": "N",
+      "label": "Need",
+      "text": "Light users = Office apps, email, web only. Which user types deliver fastest ROI?"
+    },
+    "nudge": null
+  },
+  "timelineConstraints": {
+    "form": "Customer Profile Form",
+    "hint": {
+      "tone": "time",
+      "dimension": "T",
+      "label": "Timing",
+      "text": "What's your immovable deadline? Include date AND consequence"
+    },
+    "nudge": {
+      "tone": "time",
+      "text": "Format: \"Citrix renewal Sept 30 - $500K penalty if missed\""
+    }
+  },
+  "totalUsers": {
+    "form": "Customer Profile Form",
+    "hint": {
+      "tone": "need",
+      "dimension": "N",
+      "label": "Need",
+      "text": "How many users need AVD (not total employees)? Which user types need it most urgently?"
+    },
+    "nudge": {
+      "tone": "need",
+      "text": "Include: knowledge workers + power users + CAD/engineering. Typical: 70% light, 25% medium, 5% heavy"
+    }
+  }
+});
+
+export function getCoachingHint(id) {
+  return COACHING_HINTS[id] || null;
+}
@@ -1,35 +1,51 @@
-import { useEffect, useRef, useState } from 'react';
+import { useCallback, useEffect, useRef, useState } from 'react';
+import { scheduleCoachTrigger, cancelCoachTrigger } from '../lib/coachScheduler';
+import { getCoachingHint } from '../constants/coachingHints';
 
 export default function useCoachTriggers({ idleMs = 3500 } = {}) {
   const [hint, setHint] = useState(null);
-  const focusAt = useRef(null);
+  const focused = useRef(null);
+  const pending = useRef(null);
   const edits = useRef({});
 
-  const onFocus = (id) => { 
-    focusAt.current = { id, ts: Date.now() }; 
-  };
-  
-  const onBlur = () => { 
-    focusAt.current = null; 
-    setHint(null); 
-  };
-  
-  const onEdit = (id) => { 
-    edits.current[id] = (edits.current[id] || 0) + 1; 
-  };
-
-  useEffect(() => {
-    const interval = setInterval(() => {
-      const f = focusAt.current;
-      if (f && Date.now() - f.ts >= idleMs) {
-        setHint({ id: f.id, type: 'idle' });
-      }
-    }, 500);
-    
-    return () => clearInterval(interval);
-  }, [idleMs]);
+  const cancel = useCallback(() => {
+    if (pending.current !== null) {
+      cancelCoachTrigger(pending.current);
+      pending.current = null;
+    }
+  }, []);
+
+  // One deadline per focused field, armed on the shared timer wheel
+  const arm = useCallback((id) => {
+    cancel();
+    pending.current = scheduleCoachTrigger(idleMs, () => {
+      pending.current = null;
+      setHint((prev) =>
+        prev?.id === id ? prev : { id, type: 'idle', content: getCoachingHint(id) }
+      );
+    }, `idle:${id}`);
+  }, [cancel, idleMs]);
+
+  const onFocus = useCallback((id) => {
+    focused.current = id;
+    arm(id);
+  }, [arm]);
+
+  const onBlur = useCallback(() => {
+    focused.current = null;
+    cancel();
+    setHint(null);
+  }, [cancel]);
+
+  const onEdit = useCallback((id) => {
+    edits.current[id] = (edits.current[id] || 0) + 1;
+    // Typing means the user isn't idle - push the deadline back
+    if (focused.current === id && pending.current !== null) arm(id);
+  }, [arm]);
+
+  useEffect(() => cancel, [cancel]);
 
   const shouldNudge = (id) => (edits.current[id] || 0) >= 2;
 
-  return { hint, onFocus, onBlur, onEdit, shouldNudge };
+  return { hint, onFocus, onBlur, onEdit, shouldNudge, hintFor: getCoachingHint };
 }
@@ -0,0 +1,144 @@
+// Shared timer wheel for coach triggers.
+//
+// Every mounted form schedules its idle deadline here instead of running its
+// own polling interval. Deadlines are bucketed into WHEEL_SIZE slots of
+// TICK_MS each, and a single setTimeout is armed for the earliest occupied
+// tick - so nothing wakes up while no field is focused.
+
+const TICK_MS = 100;
+const WHEEL_SIZE = 64;
+
+const slots = Array.from({ length: WHEEL_SIZE }, () => new Set());
+const entries = new Map();
+
+let currentTick = 0;
+let timer = null;
+let armedTick = null;
+let nextHandle = 1;
+
+const stats = {};
+
+const now = () => Date.now();
+
+const tickOf = (ms) => Math.ceil(ms / TICK_MS);
+
+function statsFor(trigger) {
+  if (!stats[trigger]) {
+    stats[trigger] = { armed: 0, fired: 0, cancelled: 0, totalLatencyMs: 0, maxLatencyMs: 0 };
+  }
+  return stats[trigger];
+}
+
+function earliestTick() {
+  // Scan one revolution forward from the cursor; fall back to a full scan
+  // only for deadlines further out than the wheel horizon.
+  for (let offset = 1; offset <= WHEEL_SIZE; offset++) {
+    const tick = currentTick + offset;
+    for (const entry of slots[tick % WHEEL_SIZE]) {
+      if (entry.tick <= tick) return tick;
+    }
+  }
+  let min = null;
+  for (const entry of entries.values()) {
+    if (min === null || entry.tick < min) min = entry.tick;
+  }
+  return min;
+}
+
+function disarm() {
+  if (timer !== null) clearTimeout(timer);
+  timer = null;
+  armedTick = null;
+}
+
+function arm() {
+  if (entries.size === 0) {
+    disarm();
+    return;
+  }
+  const tick = earliestTick();
+  if (timer !== null && armedTick === tick) return;
+  disarm();
+  armedTick = tick;
+  timer = setTimeout(advance, Math.max(0, tick * TICK_MS - now()));
+}
+
+function advance() {
+  timer = null;
+  armedTick = null;
+
+  const nowTick = Math.floor(now() / TICK_MS);
+  const span = Math.min(nowTick - currentTick, WHEEL_SIZE);
+  const due = [];
+
+  for (let offset = 1; offset <= span; offset++) {
+    for (const entry of slots[(currentTick + offset) % WHEEL_SIZE]) {
+      if (entry.tick <= nowTick) due.push(entry);
+    }
+  }
+  currentTick = Math.max(currentTick, nowTick);
+
+  const firedAt = now();
+  for (const entry of due) {
+    slots[entry.tick % WHEEL_SIZE].delete(entry);
+    entries.delete(entry.handle);
+
+    const counters = statsFor(entry.trigger);
+    const latency = Math.max(0, firedAt - entry.deadline);
+    counters.fired += 1;
+    counters.totalLatencyMs += latency;
+    counters.maxLatencyMs = Math.max(counters.maxLatencyMs, latency);
+
+    entry.callback();
+  }
+
+  arm();
+}
+
+export function scheduleCoachTrigger(delayMs, callback, trigger = 'idle') {
+  if (entries.size === 0) currentTick = Math.floor(now() / TICK_MS);
+
+  const deadline = now() + delayMs;
+  const entry = {
+    handle: nextHandle++,
+    tick: Math.max(tickOf(deadline), currentTick + 1),
+    deadline,
+    callback,
+    trigger,
+  };
+
+  entries.set(entry.handle, entry);
+  slots[entry.tick % WHEEL_SIZE].add(entry);
+  statsFor(trigger).armed += 1;
+
+  arm();
+  return entry.handle;
+}
+
+export function cancelCoachTrigger(handle) {
+  const entry = entries.get(handle);
+  if (!entry) return false;
+
+  entries.delete(handle);
+  slots[entry.tick % WHEEL_SIZE].delete(entry);
+  statsFor(entry.trigger).cancelled += 1;
+
+  arm();
+  return true;
+}
+
+export function getCoachTriggerStats() {
+  const snapshot = {};
+  for (const [trigger, counters] of Object.entries(stats)) {
+    snapshot[trigger] = {
+      ...counters,
+      pending: [...entries.values()].filter((e) => e.trigger === trigger).length,
+      avgLatencyMs: counters.fired ? counters.totalLatencyMs / counters.fired : 0,
+    };
+  }
+  return snapshot;
+}
+
+export function resetCoachTriggerStats() {
+  for (const trigger of Object.keys(stats)) delete stats[trigger];
+}
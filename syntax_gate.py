@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Syntax gate for codemod output.
+
+Parses JS/JSX files with esbuild's transform API (esbuild is a devDependency)
+in a worker pool and reports syntax errors and duplicate bindings (e.g. a
+second `import NTENTBadge ...`) with their exact file:line:col, instead of
+finding out when `vite build` fails. Results are cached by content hash in
+.syntax-gate-cache.json (keyed on esbuild version, loader and content), so
+unchanged files cost nothing on the next run.
+
+Python patch scripts (including Py Scripts/*) write through write_checked().
+The new content is checked before it touches disk and only written if it adds
+no problems the file did not already have, so a partial repair of an
+already-broken file is kept:
+
+    from syntax_gate import write_checked
+    if not write_checked('src/utils/export/pdf-generator.js', content):
+        sys.exit(1)
+
+For shell scripts, snapshot first and check afterwards:
+
+    python3 syntax_gate.py --snapshot   # save current JS/JSX contents
+    ./some-patch.sh
+    python3 syntax_gate.py --rollback   # check changed files, restore offenders from the snapshot
+    python3 syntax_gate.py a.jsx b.js   # just report on specific files
+"""
+import difflib
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ESBUILD_PACKAGE = os.path.join(ROOT, 'node_modules', 'esbuild', 'package.json')
+CACHE_FILE = os.path.join(ROOT, '.syntax-gate-cache.json')
+SNAPSHOT_FILE = os.path.join(ROOT, '.syntax-gate-snapshot.json')
+
+LOADERS = {'.js': 'js', '.mjs': 'js', '.jsx': 'jsx'}
+
+# Reads {path: [loader, code]} on stdin, writes {path: [[line, col, message], ...]}.
+# esbuild reports line 1-based and column 0-based; columns are emitted 1-based.
+PARSE_SCRIPT = r"""
+const { transformSync } = require('esbuild');
+let input = '';
+process.stdin.on('data', (chunk) => { input += chunk; });
+process.stdin.on('end', () => {
+  const results = {};
+  for (const [path, [loader, code]] of Object.entries(JSON.parse(input))) {
+    try {
+      transformSync(code, { loader, sourcefile: path, logLevel: 'silent' });
+      results[path] = [];
+    } catch (e) {
+      results[path] = (e.errors || [{ text: String(e.message) }]).map((m) => [
+        m.location ? m.location.line : 0,
+        m.location ? m.location.column + 1 : 0,
+        m.text,
+      ]);
+    }
+  }
+  process.stdout.write(JSON.stringify(results));
+});
+"""
+
+
+class EsbuildMissing(RuntimeError):
+    pass
+
+
+def _loader(path):
+    return LOADERS.get(os.path.splitext(path)[1])
+
+
+def _digest(version, loader, content):
+    return hashlib.sha256(f"{version}\0{loader}\0{content}".encode('utf-8')).hexdigest()
+
+
+def _require_esbuild():
+    if not shutil.which('node') or not os.path.exists(ESBUILD_PACKAGE):
+        raise EsbuildMissing("esbuild is not installed - run npm install first")
+
+
+def _esbuild_version():
+    return _load_json(ESBUILD_PACKAGE).get('version', 'unknown')
+
+
+def _load_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def _parse_batch(batch):
+    """Parse {path: content} in one node process; return {path: [[line, col, message], ...]}."""
+    payload = {path: [_loader(path), content] for path, content in batch.items()}
+    result = subprocess.run(
+        ['node', '-e', PARSE_SCRIPT],
+        input=json.dumps(payload), capture_output=True, text=True, encoding='utf-8', cwd=ROOT,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"esbuild parse failed: {result.stderr.strip()}")
+    return json.loads(result.stdout)
+
+
+def format_problems(path, problems):
+    return [f"{path}:{line}:{col}: {message}" for line, col, message in problems]
+
+
+def added_problems(before_content, before, after_content, after):
+    """
+    Problems in after that the edit from before_content to after_content added.
+
+    esbuild stops at the first error, so a broken file is only checked up to
+    that error and a repair usually exposes the next one, often with a
+    different message. Lines are matched with difflib and each problem in
+    after is judged by where it sits:
+      - on an edited line: added, unless before had the same message in that hunk;
+      - on an unchanged line: added, unless before had the same message on that
+        line, or the line lies past before's last error (code the parser never
+        reached) and no edit was made past that error either.
+    Limit: while an old error is still present, whatever breaks after it is
+    invisible in both versions and is not reported.
+    """
+    if not before:
+        return list(after)
+
+    old_lines = before_content.split('\n')
+    opcodes = difflib.SequenceMatcher(None, old_lines, after_content.split('\n'), autojunk=False).get_opcodes()
+    reached = max(line for line, _, _ in before)
+    edits_reached = all(i1 < reached for tag, i1, _, _, _ in opcodes if tag != 'equal')
+
+    seen = {}
+    for line, _, message in before:
+        seen.setdefault(line, set()).add(message)
+
+    added = []
+    for problem in after:
+        line, _, message = problem
+        if not line:
+            if message not in seen.get(0, ()):
+                added.append(problem)
+            continue
+
+        index = line - 1
+        tag, i1, i2, j1, _ = next(
+            (op for op in opcodes if op[3] <= index < op[4]),
+            ('insert', len(old_lines), len(old_lines), index, index + 1),
+        )
+        if tag == 'equal':
+            old = i1 + (index - j1) + 1
+            kept = message in seen.get(old, ()) or (old > reached and edits_reached)
+        else:
+            kept = any(i1 < old <= max(i2, i1 + 1) and message in messages for old, messages in seen.items())
+        if not kept:
+            added.append(problem)
+    return added
+
+
+def check_contents(items):
+    """
+    Validate {path: content} in parallel.
+    Returns {path: [[line, col, message], ...]}, empty for files that parse cleanly.
+    """
+    _require_esbuild()
+
+    version = _esbuild_version()
+    cache = _load_json(CACHE_FILE)
+    results = {}
+    pending = {}
+
+    for path, content in items.items():
+        key = _digest(version, _loader(path), content)
+        if key in cache:
+            results[path] = cache[key]
+        else:
+            pending[path] = content
+
+    if pending:
+        workers = min(len(pending), os.cpu_count() or 4)
+        paths = sorted(pending)
+        batches = [{path: pending[path] for path in paths[i::workers]} for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for parsed in pool.map(_parse_batch, batches):
+                for path, problems in parsed.items():
+                    results[path] = cache[_digest(version, _loader(path), pending[path])] = problems
+        _save_json(CACHE_FILE, cache)
+
+    return results
+
+
+def check_files(paths):
+    items = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            items[path] = f.read()
+    return check_contents(items)
+
+
+def write_checked(path, content):
+    """
+    Run the gate on content, then write it to path. Nothing is written if the
+    check cannot run or content adds problems the current file does not have;
+    if the write itself fails, the previous content is restored. Returns
+    whether content was written.
+    """
+    previous = None
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            previous = f.read()
+
+    if _loader(path):
+        items = {path: content}
+        if previous is not None:
+            items[f"before:{path}"] = previous
+        try:
+            results = check_contents(items)
+        except Exception as e:
+            print(f"❌ Cannot check {path}: {e}")
+            print("   Nothing was written.")
+            return False
+
+        added = added_problems(previous or '', results.get(f"before:{path}", []), content, results[path])
+        if added:
+            print(f"❌ Syntax gate rejected {path} - nothing was written")
+            for problem in format_problems(path, added):
+                print(f"    {problem}")
+            return False
+
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+    except Exception as e:
+        if previous is None:
+            if os.path.exists(path):
+                os.remove(path)
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(previous)
+        print(f"❌ Could not write {path}: {e}")
+        print("   Previous content restored.")
+        return False
+
+    return True
+
+
+def _git_lines(*args):
+    result = subprocess.run(['git', *args], capture_output=True, text=True, cwd=ROOT)
+    return [line for line in result.stdout.split('\n') if line]
+
+
+def js_files():
+    """All tracked and untracked (non-ignored) JS/JSX files."""
+    paths = _git_lines('ls-files') + _git_lines('ls-files', '--others', '--exclude-standard')
+    return sorted(p for p in set(paths) if _loader(p) and os.path.exists(os.path.join(ROOT, p)))
+
+
+def changed_files():
+    """JS/JSX files modified or added relative to HEAD (tracked and untracked)."""
+    paths = _git_lines('diff', '--name-only', 'HEAD') + _git_lines('ls-files', '--others', '--exclude-standard')
+    return sorted(p for p in set(paths) if _loader(p) and os.path.exists(os.path.join(ROOT, p)))
+
+
+def snapshot():
+    contents = {}
+    for path in js_files():
+        with open(path, 'r', encoding='utf-8') as f:
+            contents[path] = f.read()
+    _save_json(SNAPSHOT_FILE, contents)
+    print(f"✓ Snapshot of {len(contents)} JS/JSX file(s) saved to {os.path.basename(SNAPSHOT_FILE)}")
+
+
+def rollback(failed, results):
+    """Restore files whose patch added problems to their pre-patch snapshot content."""
+    saved = _load_json(SNAPSHOT_FILE)
+    if not saved:
+        print("  ⚠ No snapshot found - nothing rolled back (run --snapshot before patching)")
+        return
+
+    before = check_contents({f"before:{path}": saved[path] for path in failed if path in saved})
+    for path in failed:
+        if path not in saved:
+            print(f"  ⚠ {path} is not in the snapshot - left in place")
+            continue
+
+        with open(path, 'r', encoding='utf-8') as f:
+            current = f.read()
+        if not added_problems(saved[path], before[f"before:{path}"], current, results[path]):
+            print(f"  ⚠ {path} was already broken before the patch - left in place")
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(saved[path])
+            print(f"  ↩ Rolled back {path} to its pre-patch snapshot")
+
+
+def main():
+    args = sys.argv[1:]
+    paths = [os.path.relpath(os.path.abspath(arg), ROOT) for arg in args if not arg.startswith('--')]
+    os.chdir(ROOT)
+
+    try:
+        if '--snapshot' in args:
+            snapshot()
+            return
+
+        paths = paths or changed_files()
+        if not paths:
+            print("✓ No changed JS/JSX files to check")
+            return
+
+        results = check_files(paths)
+    except EsbuildMissing as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    failed = sorted(path for path, problems in results.items() if problems)
+
+    for path in failed:
+        for problem in format_problems(path, results[path]):
+            print(f"❌ {problem}")
+
+    if '--rollback' in args and failed:
+        rollback(failed, results)
+
+    print(f"\n{'✓' if not failed else '❌'} {len(paths) - len(failed)}/{len(paths)} file(s) parse cleanly")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
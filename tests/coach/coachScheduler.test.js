@@ -0,0 +1,90 @@
+/**
+ * Coach Trigger Scheduler Test Suite
+ *
+ * Run with: npm test
+ *
+ * Drives the shared timer wheel in src/lib/coachScheduler.js with mocked
+ * timers: schedule, cancel, deadlines past the wheel horizon, and the
+ * per-trigger latency counters.
+ */
+
+import { describe, test, beforeEach, afterEach, mock } from 'node:test';
+import assert from 'node:assert/strict';
+import {
+  scheduleCoachTrigger,
+  cancelCoachTrigger,
+  getCoachTriggerStats,
+  resetCoachTriggerStats
+} from '../../src/lib/coachScheduler.js';
+
+describe('Coach Trigger Scheduler', () => {
+
+  beforeEach(() => {
+    mock.timers.enable({ apis: ['setTimeout', 'Date'], now: 1_000_000 });
+    resetCoachTriggerStats();
+  });
+
+  afterEach(() => {
+    mock.timers.reset();
+  });
+
+  test('Fires once the deadline passes, not before', () => {
+    let fired = 0;
+    scheduleCoachTrigger(3500, () => { fired += 1; }, 'idle:totalUsers');
+
+    mock.timers.tick(3400);
+    assert.equal(fired, 0);
+
+    mock.timers.tick(200);
+    assert.equal(fired, 1);
+
+    mock.timers.tick(10_000);
+    assert.equal(fired, 1);
+  });
+
+  test('Cancelled deadlines never fire', () => {
+    let fired = false;
+    const handle = scheduleCoachTrigger(500, () => { fired = true; }, 'idle:companyName');
+
+    mock.timers.tick(200);
+    assert.equal(cancelCoachTrigger(handle), true);
+    assert.equal(cancelCoachTrigger(handle), false);
+
+    mock.timers.tick(5000);
+    assert.equal(fired, false);
+    assert.equal(getCoachTriggerStats()['idle:companyName'].cancelled, 1);
+  });
+
+  test('Deadlines past the wheel horizon (64 x 100ms) still fire on time', () => {
+    const order = [];
+    scheduleCoachTrigger(9000, () => order.push('far'), 'idle:far');
+    scheduleCoachTrigger(300, () => order.push('near'), 'idle:near');
+
+    mock.timers.tick(1000);
+    assert.deepEqual(order, ['near']);
+
+    mock.timers.tick(7900);
+    assert.deepEqual(order, ['near']);
+
+    mock.timers.tick(200);
+    assert.deepEqual(order, ['near', 'far']);
+  });
+
+  test('Latency counters are kept per trigger key', () => {
+    scheduleCoachTrigger(250, () => {}, 'idle:totalUsers');
+    scheduleCoachTrigger(250, () => {}, 'idle:totalUsers');
+    const handle = scheduleCoachTrigger(250, () => {}, 'idle:companyName');
+    cancelCoachTrigger(handle);
+
+    // Deadlines are rounded up to the next 100ms tick
+    mock.timers.tick(300);
+
+    const stats = getCoachTriggerStats();
+    assert.equal(stats['idle:totalUsers'].armed, 2);
+    assert.equal(stats['idle:totalUsers'].fired, 2);
+    assert.equal(stats['idle:totalUsers'].pending, 0);
+    assert.ok(stats['idle:totalUsers'].maxLatencyMs < 100);
+    assert.equal(stats['idle:companyName'].fired, 0);
+    assert.equal(stats['idle:companyName'].cancelled, 1);
+  });
+});
@@ -0,0 +1,74 @@
+"""
+NTENT badge injector tests.
+
+Run with: npm test (or python3 -m pytest -q tests/codemods)
+"""
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+_spec = importlib.util.spec_from_file_location('inject_ntent_badges', os.path.join(ROOT, 'inject-ntent-badges.py'))
+injector = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(injector)
+
+IMPORT = "import NTENTBadge from '../ui/NTENTBadge';"
+ANCHORS = {
+    'Number of Use Cases': injector.badge('need', 'Top 3 use cases?'),
+    'Use Cases': injector.badge('need', 'Each use case adds complexity'),
+    'Storage Type': injector.badge('edu', 'Performance test?'),
+}
+
+FORM = """import React from 'react';
+import {
+  Cloud,
+  HardDrive,
+} from 'lucide-react';
+
+export default function Form() {
+  return (
+    <div>
+      <label>
+        Number of Use Cases
+      </label>
+      <input placeholder="Number of Use Cases" />
+      <label>
+        Storage Type
+      </label>
+    </div>
+  );
+}
+"""
+
+
+def test_aho_corasick_finds_overlapping_patterns():
+    matcher = injector.AhoCorasick(['he', 'she', 'his', 'hers'])
+    assert sorted(matcher.search('ushers')) == [(1, 1), (2, 0), (2, 3)]
+
+
+def test_only_whole_line_captions_are_badged():
+    updated, inserts, _ = injector.inject(FORM, ANCHORS, IMPORT)
+
+    assert sorted(anchor for anchor, _ in inserts.values()) == ['Number of Use Cases', 'Storage Type']
+    # 'Use Cases' is a suffix of the caption and the placeholder text is not a caption line
+    assert 'Each use case adds complexity' not in updated
+    assert updated.count('Top 3 use cases?') == 1
+    assert '        Number of Use Cases\n        <NTENTBadge dimension="need"' in updated
+
+
+def test_rerun_is_a_no_op():
+    once, _, _ = injector.inject(FORM, ANCHORS, IMPORT)
+    twice, inserts, already = injector.inject(once, ANCHORS, IMPORT)
+
+    assert twice == once
+    assert inserts == {}
+    assert already == {'Number of Use Cases', 'Storage Type'}
+
+
+def test_import_goes_after_multi_line_import():
+    updated, _, _ = injector.inject(FORM, ANCHORS, IMPORT)
+
+    assert "} from 'lucide-react';\n" + IMPORT + "\n" in updated
+    assert updated.count('import NTENTBadge') == 1
@@ -0,0 +1,122 @@
+"""
+Syntax gate tests.
+
+Run with: npm test (or python3 -m pytest -q tests/codemods)
+
+esbuild itself is not needed: parsing is replaced with canned results, so
+these cover the bookkeeping around it - which problems count as added, the
+cache key, and that write_checked never leaves rejected content on disk.
+"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+import syntax_gate  # noqa: E402
+
+BROKEN = """const a = 1;
+const b = (2;
+const c = 3;
+function d() {
+  return c;
+}
+const e = 5;
+const f = ;
+"""
+
+
+def test_problems_in_a_clean_file_are_all_added():
+    after = [[2, 13, 'Expected ")" but found ";"']]
+    assert syntax_gate.added_problems(BROKEN.replace('(2;', '2;'), [], BROKEN, after) == after
+
+
+def test_partial_repair_that_exposes_the_next_error_is_kept():
+    repaired = BROKEN.replace('(2;', '2;')
+    before = [[2, 13, 'Expected ")" but found ";"']]
+    after = [[8, 11, 'Unexpected ";"']]
+
+    assert syntax_gate.added_problems(BROKEN, before, repaired, after) == []
+
+
+def test_same_error_moved_by_inserted_lines_is_not_added():
+    shifted = "import x from 'x';\nimport y from 'y';\n" + BROKEN
+    before = [[2, 13, 'Expected ")" but found ";"']]
+    after = [[4, 13, 'Expected ")" but found ";"']]
+
+    assert syntax_gate.added_problems(BROKEN, before, shifted, after) == []
+
+
+def test_break_in_an_edit_past_the_old_error_is_added():
+    # Repairs line 2, but also breaks line 5 - which the parser never reached before
+    edited = BROKEN.replace('(2;', '2;').replace('return c;', 'return c +;')
+    before = [[2, 13, 'Expected ")" but found ";"']]
+    after = [[5, 13, 'Unexpected ";"']]
+
+    assert syntax_gate.added_problems(BROKEN, before, edited, after) == after
+
+
+def test_break_behind_a_remaining_error_is_not_seen():
+    # Documented limit: esbuild stops at line 2 in both versions, so the new
+    # break on line 5 produces no problem to compare.
+    edited = BROKEN.replace('return c;', 'return c +;')
+    before = [[2, 13, 'Expected ")" but found ";"']]
+    after = [[2, 13, 'Expected ")" but found ";"']]
+
+    assert syntax_gate.added_problems(BROKEN, before, edited, after) == []
+
+
+def test_cache_key_ignores_the_path(tmp_path, monkeypatch):
+    parsed = []
+
+    def parse_batch(batch):
+        parsed.extend(batch)
+        return {path: [] for path in batch}
+
+    monkeypatch.setattr(syntax_gate, 'CACHE_FILE', str(tmp_path / 'cache.json'))
+    monkeypatch.setattr(syntax_gate, '_require_esbuild', lambda: None)
+    monkeypatch.setattr(syntax_gate, '_esbuild_version', lambda: '0.21.5')
+    monkeypatch.setattr(syntax_gate, '_parse_batch', parse_batch)
+
+    syntax_gate.check_contents({'src/a.js': 'const a = 1;'})
+    syntax_gate.check_contents({'before:src/a.js': 'const a = 1;', 'src/b.js': 'const a = 1;'})
+    assert parsed == ['src/a.js']
+
+    monkeypatch.setattr(syntax_gate, '_esbuild_version', lambda: '0.22.0')
+    syntax_gate.check_contents({'src/a.js': 'const a = 1;'})
+    assert parsed == ['src/a.js', 'src/a.js']
+
+
+@pytest.fixture
+def target(tmp_path):
+    path = tmp_path / 'generator.js'
+    path.write_text('const a = 1;\n', encoding='utf-8')
+    return path
+
+
+def test_write_checked_leaves_file_untouched_when_check_fails(target, monkeypatch):
+    def fail(items):
+        raise RuntimeError('esbuild parse failed: worker crashed')
+
+    monkeypatch.setattr(syntax_gate, 'check_contents', fail)
+
+    assert syntax_gate.write_checked(str(target), 'const a = (;\n') is False
+    assert target.read_text(encoding='utf-8') == 'const a = 1;\n'
+
+
+def test_write_checked_rejects_before_writing(target, monkeypatch):
+    monkeypatch.setattr(syntax_gate, 'check_contents', lambda items: {
+        path: [] if path.startswith('before:') else [[1, 12, 'Unexpected ";"']] for path in items
+    })
+
+    assert syntax_gate.write_checked(str(target), 'const a = (;\n') is False
+    assert target.read_text(encoding='utf-8') == 'const a = 1;\n'
+
+
+def test_write_checked_writes_clean_content(target, monkeypatch):
+    monkeypatch.setattr(syntax_gate, 'check_contents', lambda items: {path: [] for path in items})
+
+    assert syntax_gate.write_checked(str(target), 'const a = 2;\n') is True
+    assert target.read_text(encoding='utf-8') == 'const a = 2;\n'